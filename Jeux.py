@@ -1,11 +1,26 @@
 import numpy as np
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba est optionnel : repli sur NumPy
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr est optionnel : repli sur NumPy
+    ne = None
+
+# Le style graphique est global à matplotlib : on ne le configure qu'une fois par processus
+_STYLE_CONFIGURED = False
+
 class SkyrockGamingAnalyzer:
     def __init__(self):
         """
@@ -14,31 +29,37 @@ class SkyrockGamingAnalyzer:
         self.gaming_data = self._create_gaming_revenue_data()
         self.regulatory_data = self._create_regulatory_data()
         
+        # Colonnes pré-calculées (ordre chronologique) pour les agrégations vectorisées
+        self._years = self.gaming_data.index.to_numpy()
+        self._rev = self.gaming_data['revenue'].to_numpy()
+        self._bets = self.gaming_data['bets'].to_numpy()
+        self._players = self.gaming_data['players'].to_numpy()
+        self._types = self.gaming_data['type'].to_numpy()
+        self._cum_rev = np.cumsum(self._rev)
+        for column in (self._years, self._rev, self._bets, self._players, self._types, self._cum_rev):
+            column.setflags(write=False)
+        market_size = self._create_market_data()
+        self._market = np.array([market_size[y] for y in self._years])
+        
         # Configuration stylistique
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
+        global _STYLE_CONFIGURED
+        if not _STYLE_CONFIGURED:
+            plt.style.use('seaborn-v0_8')
+            _STYLE_CONFIGURED = True
         
     def _create_gaming_revenue_data(self):
         """
         Crée des données de revenus basées sur les rapports ARJEL/ANJ
         """
         # Données estimées basées sur les rapports réglementaires publics
-        gaming_revenue = {
-            2010: {'revenue': 0.8, 'players': 15000, 'bets': 12.5, 'type': 'Lancement'},
-            2011: {'revenue': 1.5, 'players': 28000, 'bets': 25.0, 'type': 'Croissance'},
-            2012: {'revenue': 2.2, 'players': 42000, 'bets': 38.5, 'type': 'Croissance'},
-            2013: {'revenue': 2.8, 'players': 55000, 'bets': 52.0, 'type': 'Croissance'},
-            2014: {'revenue': 3.5, 'players': 68000, 'bets': 68.5, 'type': 'Pic'},
-            2015: {'revenue': 4.2, 'players': 75000, 'bets': 85.0, 'type': 'Pic'},
-            2016: {'revenue': 4.0, 'players': 72000, 'bets': 78.0, 'type': 'Stabilisation'},
-            2017: {'revenue': 3.8, 'players': 70000, 'bets': 72.5, 'type': 'Stabilisation'},
-            2018: {'revenue': 3.2, 'players': 65000, 'bets': 65.0, 'type': 'Declin'},
-            2019: {'revenue': 2.5, 'players': 55000, 'bets': 55.0, 'type': 'Declin'},
-            2020: {'revenue': 1.8, 'players': 40000, 'bets': 42.5, 'type': 'COVID'},
-            2021: {'revenue': 1.2, 'players': 30000, 'bets': 35.0, 'type': 'Declin'},
-            2022: {'revenue': 0.9, 'players': 25000, 'bets': 28.5, 'type': 'Residuel'},
-            2023: {'revenue': 0.7, 'players': 22000, 'bets': 25.0, 'type': 'Residuel'}
-        }
+        gaming_revenue = pd.DataFrame({
+            'year': [2010, 2011, 2012, 2013, 2014, 2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023],
+            'revenue': [0.8, 1.5, 2.2, 2.8, 3.5, 4.2, 4.0, 3.8, 3.2, 2.5, 1.8, 1.2, 0.9, 0.7],
+            'players': [15000, 28000, 42000, 55000, 68000, 75000, 72000, 70000, 65000, 55000, 40000, 30000, 25000, 22000],
+            'bets': [12.5, 25.0, 38.5, 52.0, 68.5, 85.0, 78.0, 72.5, 65.0, 55.0, 42.5, 35.0, 28.5, 25.0],
+            'type': ['Lancement', 'Croissance', 'Croissance', 'Croissance', 'Pic', 'Pic', 'Stabilisation',
+                     'Stabilisation', 'Declin', 'Declin', 'COVID', 'Declin', 'Residuel', 'Residuel']
+        }).set_index('year')
         return gaming_revenue
     
     def _create_regulatory_data(self):
@@ -57,72 +78,101 @@ class SkyrockGamingAnalyzer:
         }
         return regulatory_events
     
+    def _create_market_data(self):
+        """
+        Taille du marché français des jeux en ligne (estimations en milliards €)
+        """
+        market_size = {
+            2010: 0.8, 2011: 1.2, 2012: 1.6, 2013: 2.0, 2014: 2.4,
+            2015: 2.8, 2016: 3.2, 2017: 3.6, 2018: 4.0, 2019: 4.4,
+            2020: 4.8, 2021: 5.2, 2022: 5.6, 2023: 6.0
+        }
+        return market_size
+    
     def calculate_cumulative_revenue(self):
         """
         Calcule les revenus cumulés sur la période
         """
-        total_revenue = sum([data['revenue'] for data in self.gaming_data.values()])
-        total_bets = sum([data['bets'] for data in self.gaming_data.values()])
-        total_players = max([data['players'] for data in self.gaming_data.values()])
+        revenue_total, bets_total, revenue_moyen_an = np.round(
+            [self._cum_rev[-1], self._bets.sum(), self._rev.mean()], 2).tolist()
         
         return {
-            'revenue_total': round(total_revenue, 2),
-            'bets_total': round(total_bets, 2),
-            'players_max': total_players,
-            'revenue_moyen_an': round(total_revenue / len(self.gaming_data), 2),
-            'periode': f"{min(self.gaming_data.keys())}-{max(self.gaming_data.keys())}"
+            'revenue_total': revenue_total,
+            'bets_total': bets_total,
+            'players_max': int(self._players.max()),
+            'revenue_moyen_an': revenue_moyen_an,
+            'periode': f"{self._years[0]}-{self._years[-1]}"
         }
     
+    def _profit_array(self, margin_rate=0.18):
+        """
+        Profits estimés (M€) alignés sur self._years
+        """
+        if ne is not None:
+            profits = ne.evaluate('rev * m', local_dict={'rev': self._rev, 'm': margin_rate})
+        else:
+            profits = self._rev * margin_rate
+        return np.round(profits, 2)
+    
     def estimate_profits(self, margin_rate=0.18):
         """
         Estime les profits basés sur les revenus et une marge typique du secteur
         """
-        profits = {}
-        for year, data in self.gaming_data.items():
-            revenue = data['revenue']
-            profit = revenue * margin_rate
-            profits[year] = {
+        profits_arr = self._profit_array(margin_rate)
+        
+        profits = {
+            year: {
                 'revenue': revenue,
-                'profit': round(profit, 2),
+                'profit': profit,
                 'margin_rate': margin_rate
             }
+            for year, revenue, profit in zip(self._years.tolist(), self._rev.tolist(), profits_arr.tolist())
+        }
         
-        total_profit = sum([p['profit'] for p in profits.values()])
+        total_profit = float(profits_arr.sum())
         return profits, total_profit
     
+    def _market_share_array(self):
+        """
+        Parts de marché (%) alignées sur self._years
+        """
+        # Revenus Skyrock en millions, marché converti de milliards en millions
+        return np.round(self._rev / (self._market * 1000.0) * 100.0, 2)
+    
     def analyze_market_share(self):
         """
         Analyse la part de marché de Skyrock dans le secteur des jeux en ligne
         """
-        # Données du marché français (estimations en milliards €)
-        market_size = {
-            2010: 0.8, 2011: 1.2, 2012: 1.6, 2013: 2.0, 2014: 2.4,
-            2015: 2.8, 2016: 3.2, 2017: 3.6, 2018: 4.0, 2019: 4.4,
-            2020: 4.8, 2021: 5.2, 2022: 5.6, 2023: 6.0
-        }
-        
-        market_shares = {}
-        for year, data in self.gaming_data.items():
-            skyrock_revenue = data['revenue']  # en millions
-            total_market = market_size[year] * 1000  # conversion en millions
-            market_share = (skyrock_revenue / total_market) * 100
-            market_shares[year] = round(market_share, 2)
-        
-        return market_shares
+        shares = self._market_share_array()
+        return dict(zip(self._years.tolist(), shares.tolist()))
     
-    def create_detailed_analysis(self):
+    def create_detailed_analysis(self, dpi=150, show=True, bbox_inches=None):
         """
         Crée une analyse détaillée avec visualisations
+        
+        dpi: résolution de l'image sauvegardée (le coût de rendu croît avec dpi²)
+        show: affiche la figure (à désactiver en mode batch)
+        bbox_inches: passer 'tight' pour rogner les marges (passe de rendu supplémentaire)
         """
         fig, axes = plt.subplots(2, 3, figsize=(20, 12))
         fig.suptitle('ANALYSE DES REVENUS JEUX D\'ARGENT SKYROCK (2010-2023)\nDonnées basées sur ARJEL/ANJ', 
                     fontsize=16, fontweight='bold', y=0.95)
         
-        # 1. Évolution des revenus
-        years = list(self.gaming_data.keys())
-        revenues = [data['revenue'] for data in self.gaming_data.values()]
-        players = [data['players'] for data in self.gaming_data.values()]
+        years = self._years
+        revenues = self._rev
+        players = self._players
+        bets = self._bets
+        shares = self._market_share_array()
+        profit_values = self._profit_array()
+        
+        # Libellés calculés une seule fois pour tous les graphiques
+        revenue_labels = [f'{revenue}M€' for revenue in revenues]
+        player_labels = [f'{player_count//1000}K' for player_count in players]
+        share_labels = [f'{share}%' for share in shares]
+        profit_labels = [f'{profit:.2f}M€' if profit > 0.1 else '' for profit in profit_values]
+        bet_labels = [f'{bet}M€' for bet in bets]
         
+        # 1. Évolution des revenus
         ax1 = axes[0, 0]
         ax1.plot(years, revenues, marker='o', linewidth=3, markersize=8, color='#E31A1C')
         ax1.set_title('Évolution des Revenus (Millions €)', fontsize=14, fontweight='bold')
@@ -132,42 +182,35 @@ class SkyrockGamingAnalyzer:
         ax1.fill_between(years, revenues, alpha=0.3, color='#E31A1C')
         
         # Ajouter les valeurs sur le graphique
-        for i, (year, revenue) in enumerate(zip(years, revenues)):
-            ax1.annotate(f'{revenue}M€', (year, revenue), 
+        for label, year, revenue in zip(revenue_labels, years, revenues):
+            ax1.annotate(label, (year, revenue), 
                         xytext=(0, 10), textcoords='offset points', 
                         ha='center', va='bottom', fontweight='bold')
         
         # 2. Nombre de joueurs
         ax2 = axes[0, 1]
-        ax2.bar(years, players, color='#1F78B4', alpha=0.7)
+        player_bars = ax2.bar(years, players, color='#1F78B4', alpha=0.7)
         ax2.set_title('Évolution du Nombre de Joueurs', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Année')
         ax2.set_ylabel('Nombre de Joueurs')
         ax2.tick_params(axis='x', rotation=45)
         
-        for i, (year, player_count) in enumerate(zip(years, players)):
-            ax2.text(year, player_count + 1000, f'{player_count//1000}K', 
-                    ha='center', va='bottom', fontsize=9)
+        ax2.bar_label(player_bars, labels=player_labels, fontsize=9)
         
         # 3. Parts de marché
-        market_shares = self.analyze_market_share()
         ax3 = axes[0, 2]
-        ax3.plot(list(market_shares.keys()), list(market_shares.values()), 
-                marker='s', color='#33A02C', linewidth=2)
+        ax3.plot(years, shares, marker='s', color='#33A02C', linewidth=2)
         ax3.set_title('Part de Marché Skyrock (%)', fontsize=14, fontweight='bold')
         ax3.set_xlabel('Année')
         ax3.set_ylabel('Part de Marché (%)')
         ax3.grid(True, alpha=0.3)
         
-        for year, share in market_shares.items():
-            ax3.annotate(f'{share}%', (year, share), 
+        for label, year, share in zip(share_labels, years, shares):
+            ax3.annotate(label, (year, share), 
                         xytext=(0, 5), textcoords='offset points', 
                         ha='center', va='bottom')
         
         # 4. Analyse des profits
-        profits, total_profit = self.estimate_profits()
-        profit_values = [profits[year]['profit'] for year in years]
-        
         ax4 = axes[1, 0]
         bars = ax4.bar(years, profit_values, color='#FF7F00', alpha=0.7)
         ax4.set_title('Profits Estimés (Marge 18%)', fontsize=14, fontweight='bold')
@@ -175,14 +218,9 @@ class SkyrockGamingAnalyzer:
         ax4.set_ylabel('Profits (M€)')
         ax4.tick_params(axis='x', rotation=45)
         
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0.1:
-                ax4.text(bar.get_x() + bar.get_width()/2., height + 0.02,
-                        f'{height:.2f}M€', ha='center', va='bottom', fontsize=8)
+        ax4.bar_label(bars, labels=profit_labels, fontsize=8)
         
         # 5. Mises totales
-        bets = [data['bets'] for data in self.gaming_data.values()]
         ax5 = axes[1, 1]
         ax5.plot(years, bets, marker='D', color='#6A3D9A', linewidth=2)
         ax5.set_title('Volume des Mises (Millions €)', fontsize=14, fontweight='bold')
@@ -191,22 +229,29 @@ class SkyrockGamingAnalyzer:
         ax5.grid(True, alpha=0.3)
         ax5.fill_between(years, bets, alpha=0.2, color='#6A3D9A')
         
-        for i, (year, bet) in enumerate(zip(years, bets)):
-            ax5.annotate(f'{bet}M€', (year, bet), 
+        for label, year, bet in zip(bet_labels, years, bets):
+            ax5.annotate(label, (year, bet), 
                         xytext=(0, 10), textcoords='offset points', 
                         ha='center', va='bottom', fontsize=8)
         
         # 6. Analyse cumulative
-        cumulative_revenue = np.cumsum(revenues)
+        cumulative_revenue = self._cum_rev
         cumulative_profit = np.cumsum(profit_values)
         
         ax6 = axes[1, 2]
-        ax6.plot(years, cumulative_revenue, label='Revenus Cumulés', linewidth=3, color='#E31A1C')
-        ax6.plot(years, cumulative_profit, label='Profits Cumulés', linewidth=3, color='#33A02C')
+        cumulative_colors = ['#E31A1C', '#33A02C']
+        cumulative_labels = ['Revenus Cumulés', 'Profits Cumulés']
+        # Les deux courbes dans une seule collection (un seul artiste à dessiner)
+        cumulative_lines = LineCollection(
+            [np.column_stack([years, cumulative_revenue]), np.column_stack([years, cumulative_profit])],
+            colors=cumulative_colors, linewidths=3)
+        ax6.add_collection(cumulative_lines)
+        ax6.autoscale_view()
         ax6.set_title('Analyse Cumulative (2010-2023)', fontsize=14, fontweight='bold')
         ax6.set_xlabel('Année')
         ax6.set_ylabel('Montant Cumulé (M€)')
-        ax6.legend()
+        ax6.legend([Line2D([], [], color=color, linewidth=3) for color in cumulative_colors],
+                   cumulative_labels)
         ax6.grid(True, alpha=0.3)
         
         # Dernière valeur annotée
@@ -216,8 +261,9 @@ class SkyrockGamingAnalyzer:
                     xytext=(10, -15), textcoords='offset points', fontweight='bold')
         
         plt.tight_layout()
-        plt.savefig('analyse_jeux_argent_skyrock.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        plt.savefig('analyse_jeux_argent_skyrock.png', dpi=dpi, bbox_inches=bbox_inches)
+        if show:
+            plt.show()
         
         # Génération du rapport détaillé
         self.generate_comprehensive_report()
@@ -234,7 +280,7 @@ class SkyrockGamingAnalyzer:
         # Calcul des indicateurs clés
         cumulative = self.calculate_cumulative_revenue()
         profits, total_profit = self.estimate_profits()
-        market_shares = self.analyze_market_share()
+        shares = self._market_share_array()
         
         print(f"\n📊 CHIFFRES CLÉS 2010-2023")
         print(f"   💰 Revenus totaux: {cumulative['revenue_total']} millions d'euros")
@@ -245,25 +291,25 @@ class SkyrockGamingAnalyzer:
         
         print(f"\n📈 ÉVOLUTION DU BUSINESS")
         # Meilleure année
-        best_year = max(self.gaming_data.items(), key=lambda x: x[1]['revenue'])
-        worst_year = min(self.gaming_data.items(), key=lambda x: x[1]['revenue'])
+        best_idx = int(self._rev.argmax())
+        worst_idx = int(self._rev.argmin())
         
-        print(f"   🏆 Meilleure année: {best_year[0]} ({best_year[1]['revenue']}M€ - {best_year[1]['type']})")
-        print(f"   📉 Plus faible année: {worst_year[0]} ({worst_year[1]['revenue']}M€ - {worst_year[1]['type']})")
+        print(f"   🏆 Meilleure année: {self._years[best_idx]} ({self._rev[best_idx]}M€ - {self._types[best_idx]})")
+        print(f"   📉 Plus faible année: {self._years[worst_idx]} ({self._rev[worst_idx]}M€ - {self._types[worst_idx]})")
         
         # Tendance générale
-        first_year = min(self.gaming_data.keys())
-        last_year = max(self.gaming_data.keys())
-        growth = ((self.gaming_data[last_year]['revenue'] - self.gaming_data[first_year]['revenue']) / 
-                 self.gaming_data[first_year]['revenue'] * 100)
+        first_year = self._years[0]
+        last_year = self._years[-1]
+        growth = (self._rev[-1] - self._rev[0]) / self._rev[0] * 100
         
         print(f"   📊 Tendance {first_year}-{last_year}: {growth:+.1f}%")
         
         print(f"\n🌍 ANALYSE DE MARCHÉ")
         # Part de marché moyenne
-        avg_market_share = np.mean(list(market_shares.values()))
-        max_market_share = max(market_shares.values())
-        max_share_year = [year for year, share in market_shares.items() if share == max_market_share][0]
+        max_share_idx = int(shares.argmax())
+        avg_market_share = shares.mean()
+        max_market_share = shares[max_share_idx]
+        max_share_year = self._years[max_share_idx]
         
         print(f"   📊 Part de marché moyenne: {avg_market_share:.2f}%")
         print(f"   🎯 Pic de part de marché: {max_market_share:.2f}% ({max_share_year})")
@@ -280,7 +326,7 @@ class SkyrockGamingAnalyzer:
         print(f"      - Dépendance au marché français uniquement")
         
         print(f"\n🔮 PERSPECTIVES")
-        if self.gaming_data[2023]['revenue'] < 1.0:
+        if self.gaming_data.loc[2023, 'revenue'] < 1.0:
             print(f"   📊 Situation actuelle: Activité résiduelle")
             print(f"   💡 Recommandations:")
             print(f"      - Recentrage sur le cœur de métier radio")
@@ -304,83 +350,132 @@ class SkyrockGamingAnalyzer:
         """
         Exporte les données vers Excel
         """
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Données de base
-            base_data = []
-            for year, data in self.gaming_data.items():
-                market_share = self.analyze_market_share()[year]
-                profits = self.estimate_profits()[0][year]
-                
-                base_data.append({
-                    'Année': year,
-                    'Revenus (M€)': data['revenue'],
-                    'Joueurs': data['players'],
-                    'Mises (M€)': data['bets'],
-                    'Période Type': data['type'],
-                    'Part Marché (%)': market_share,
-                    'Profit Estimé (M€)': profits['profit'],
-                    'Marge (%)': profits['margin_rate'] * 100
-                })
-            
-            df_base = pd.DataFrame(base_data)
-            df_base.to_excel(writer, sheet_name='Données Détaillées', index=False)
-            
-            # Analyse cumulative
-            cumulative = self.calculate_cumulative_revenue()
-            df_cumul = pd.DataFrame([cumulative])
-            df_cumul.to_excel(writer, sheet_name='Analyse Cumulative', index=False)
-            
-            # Événements réglementaires
-            events_data = [{'Année': year, 'Événement': event} 
-                         for year, event in self.regulatory_data.items()]
-            df_events = pd.DataFrame(events_data)
-            df_events.to_excel(writer, sheet_name='Événements Réglementaires', index=False)
-            
-            # Résumé exécutif
-            summary_data = {
-                'Indicateur': [
-                    'Revenus Totaux (M€)',
-                    'Profits Totaux Estimés (M€)',
-                    'Mises Totales (M€)',
-                    'Joueurs Maximum',
-                    'Période Analysée',
-                    'Part de Marché Moyenne (%)'
-                ],
-                'Valeur': [
-                    cumulative['revenue_total'],
-                    round(self.estimate_profits()[1], 2),
-                    cumulative['bets_total'],
-                    cumulative['players_max'],
-                    cumulative['periode'],
-                    round(np.mean(list(self.analyze_market_share().values())), 2)
-                ]
-            }
-            df_summary = pd.DataFrame(summary_data)
-            df_summary.to_excel(writer, sheet_name='Résumé Exécutif', index=False)
+        margin_rate = 0.18
+        shares_arr = self._market_share_array()
+        profits_arr = self._profit_array(margin_rate)
+        
+        # Données de base
+        df_base = pd.DataFrame({
+            'Année': self._years,
+            'Revenus (M€)': self._rev,
+            'Joueurs': self._players,
+            'Mises (M€)': self._bets,
+            'Période Type': self._types,
+            'Part Marché (%)': shares_arr,
+            'Profit Estimé (M€)': profits_arr,
+            'Marge (%)': margin_rate * 100
+        })
+        
+        # Analyse cumulative
+        cumulative = self.calculate_cumulative_revenue()
+        df_cumul = pd.DataFrame([cumulative])
+        
+        # Événements réglementaires
+        df_events = pd.DataFrame({
+            'Année': list(self.regulatory_data.keys()),
+            'Événement': list(self.regulatory_data.values())
+        })
+        
+        # Résumé exécutif
+        total_profit, avg_market_share = np.round([profits_arr.sum(), shares_arr.mean()], 2).tolist()
+        df_summary = pd.DataFrame({
+            'Indicateur': [
+                'Revenus Totaux (M€)',
+                'Profits Totaux Estimés (M€)',
+                'Mises Totales (M€)',
+                'Joueurs Maximum',
+                'Période Analysée',
+                'Part de Marché Moyenne (%)'
+            ],
+            'Valeur': [
+                cumulative['revenue_total'],
+                total_profit,
+                cumulative['bets_total'],
+                cumulative['players_max'],
+                cumulative['periode'],
+                avg_market_share
+            ]
+        })
+        
+        sheets = {
+            'Données Détaillées': df_base,
+            'Analyse Cumulative': df_cumul,
+            'Événements Réglementaires': df_events,
+            'Résumé Exécutif': df_summary
+        }
+        
+        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
+            for sheet_name, df in sheets.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
         
         print(f"✅ Données exportées vers {filename}")
 
+# Noyau de balayage de scénarios : revenu total de chaque ligne de multiplicateurs
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _sweep(rev, mult_matrix):
+        out = np.empty(mult_matrix.shape[0])
+        for i in prange(mult_matrix.shape[0]):
+            out[i] = (rev * mult_matrix[i]).sum()
+        return out
+else:
+    def _sweep(rev, mult_matrix):
+        return mult_matrix @ rev
+
 # Simulation de scénarios alternatifs
 class GamingScenarioSimulator:
     def __init__(self, base_analyzer):
-        self.base_data = base_analyzer.gaming_data.copy()
+        # Colonnes en lecture seule partagées avec l'analyseur : aucune copie nécessaire
+        self._years = base_analyzer._years
+        self._rev = base_analyzer._rev
+        self._bets = base_analyzer._bets
+        self._players = base_analyzer._players
+        self._types = base_analyzer._types
         
     def simulate_scenario(self, scenario_name, parameters):
         """
         Simule différents scénarios stratégiques
         """
-        simulated_data = self.base_data.copy()
+        year_to_idx = {year: i for i, year in enumerate(self._years.tolist())}
+        multipliers = np.ones_like(self._rev)
         
         for year, multiplier in parameters.get('revenue_multipliers', {}).items():
-            if year in simulated_data:
-                simulated_data[year]['revenue'] *= multiplier
-                simulated_data[year]['players'] = int(simulated_data[year]['players'] * multiplier)
-                simulated_data[year]['bets'] *= multiplier
+            if year in year_to_idx:
+                multipliers[year_to_idx[year]] = multiplier
+        
+        return pd.DataFrame({
+            'revenue': self._rev * multipliers,
+            'players': (self._players * multipliers).astype(int),
+            'bets': self._bets * multipliers,
+            'type': self._types
+        }, index=pd.Index(self._years, name='year'))
+    
+    def sweep(self, mult_matrix):
+        """
+        Revenus totaux pour un lot de scénarios (une ligne de multiplicateurs par scénario,
+        une colonne par année de self._years)
+        """
+        mult_matrix = np.ascontiguousarray(mult_matrix, dtype=np.float64)
+        if mult_matrix.ndim != 2 or mult_matrix.shape[1] != len(self._years):
+            raise ValueError(f"mult_matrix doit avoir la forme (n_scenarios, {len(self._years)})")
+        return _sweep(np.ascontiguousarray(self._rev, dtype=np.float64), mult_matrix)
+    
+    def cumulative_revenue(self, multipliers, out=None):
+        """
+        Revenus cumulés d'un scénario (multiplicateurs alignés sur self._years)
         
-        return simulated_data
+        out: tampon préalloué réutilisé d'un scénario à l'autre lors des balayages
+        """
+        if out is None:
+            out = np.empty_like(self._rev, dtype=np.float64)
+        np.multiply(self._rev, multipliers, out=out)
+        return np.add.accumulate(out, out=out)
 
 # Exécution du programme
 if __name__ == "__main__":
+    # Backend non interactif : la figure est sauvegardée sur disque sans bloquer l'exécution
+    matplotlib.use('Agg')
+    
     print("🎰 Analyse des jeux d'argent Skyrock basée sur ARJEL/ANJ...")
     
     # Création de l'analyseur
@@ -388,7 +483,7 @@ if __name__ == "__main__":
     
     # Analyse détaillée
     print("📊 Génération de l'analyse...")
-    analyzer.create_detailed_analysis()
+    analyzer.create_detailed_analysis(show=False)
     
     # Export des données
     print("💾 Export des données...")
@@ -411,7 +506,7 @@ if __name__ == "__main__":
     scenario_data = simulator.simulate_scenario("Investissement renforcé", scenario_investissement)
     
     # Calcul du scénario alternatif
-    revenue_scenario = sum([data['revenue'] for data in scenario_data.values()])
+    revenue_scenario = scenario_data['revenue'].sum()
     revenue_reel = analyzer.calculate_cumulative_revenue()['revenue_total']
     
     print(f"\n💡 SCÉNARIO ALTERNATIF: Investissement marketing renforcé")